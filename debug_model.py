@@ -12,7 +12,7 @@ def main():
     print("Debugging 3D model loading...")
     
     # Check if model file exists
-    model_path = Path("frontend/assets/models/submarine_fiber_optic_cable_network.glb")
+    model_path = Path("frontend/static/submarine_fiber_optic_cable_network.glb")
     print(f"Model file exists: {model_path.exists()}")
     
     if model_path.exists():
@@ -9,7 +9,9 @@ import sys
 import os
 
 # Add the current directory to the Python path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+_FRONTEND_DIR = os.path.dirname(os.path.abspath(__file__))
+if _FRONTEND_DIR not in sys.path:  # the script is re-executed on every rerun
+    sys.path.append(_FRONTEND_DIR)
 
 from config import STREAMLIT_CONFIG
 from components.ui_components import (
@@ -17,9 +19,22 @@ from components.ui_components import (
     load_custom_css,
     display_interactive_background,
     display_3d_globe_component,
-    display_simple_3d_globe
+    display_simple_3d_globe,
+    get_model_url,
+    render_card_grid,
+    GLOBE_MODEL_NAME
 )
 
+_FEATURES = [
+    ("Data Trends", "Explore temporal patterns in digital access and connectivity data across countries and regions."),
+    ("AI Assistant", "Chat with AI about digital policies or generate policy petitions based on data insights."),
+    ("ML Predictions", "Use machine learning models to predict digital presence factors and analyze feature importance."),
+    ("3D Globe Visualization", "Interactive 3D model of global submarine cable networks (see next tab)."),
+    ("About Platform", "Learn about the platform's features, technology stack, and mission."),
+]
+
+_FEATURE_BOX_HTML = '<div class="content-box"><h4>{title}</h4><p>{description}</p></div>'
+
 def render_dashboard_tab():
     """Renders the main dashboard content."""
     display_page_header(
@@ -40,50 +55,10 @@ def render_dashboard_tab():
     # Page summaries
     st.subheader("Available Features")
     
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
-        <div class="content-box">
-            <h4>Data Trends</h4>
-            <p>Explore temporal patterns in digital access and connectivity data across countries and regions.</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div class="content-box">
-            <h4>AI Assistant</h4>
-            <p>Chat with AI about digital policies or generate policy petitions based on data insights.</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown("""
-        <div class="content-box">
-            <h4>ML Predictions</h4>
-            <p>Use machine learning models to predict digital presence factors and analyze feature importance.</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # Second row
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
-        <div class="content-box">
-            <h4>3D Globe Visualization</h4>
-            <p>Interactive 3D model of global submarine cable networks (see next tab).</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div class="content-box">
-            <h4>About Platform</h4>
-            <p>Learn about the platform's features, technology stack, and mission.</p>
-        </div>
-        """, unsafe_allow_html=True)
+    render_card_grid(
+        [_FEATURE_BOX_HTML.format(title=title, description=description)
+         for title, description in _FEATURES]
+    )
 
 def render_globe_tab():
     """Renders the 3D globe visualization tab."""
@@ -104,11 +79,15 @@ def render_globe_tab():
     detailed_tab, simple_tab = st.tabs(["🌊 Submarine Cables (Detailed)", "🌍 Globe (Lightweight)"])
     
     with detailed_tab:
-        st.markdown("""
+        if get_model_url(GLOBE_MODEL_NAME):
+            load_note = "This model is 9.7MB; your browser caches it after the first load."
+        else:
+            load_note = "This model is 9.7MB and may take 10-30 seconds to load."
+        st.markdown(f"""
         <div class="content-box">
             <h4>Detailed Submarine Cable Network</h4>
             <p>This high-detail 3D model shows the actual underwater fiber optic cables. 
-            <strong>Note:</strong> This model is 9.7MB and may take 10-30 seconds to load.</p>
+            <strong>Note:</strong> {load_note}</p>
         </div>
         """, unsafe_allow_html=True)
         
@@ -3,222 +3,326 @@ UI styling and component utilities for the Digital Divide Policy frontend.
 """
 
 import streamlit as st
-import base64
+import gzip
+import mmap
+import re
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterable
+
+try:
+    import pybase64 as _b64  # SIMD-accelerated, API-compatible with base64
+except ImportError:
+    import base64 as _b64
 
 # --- PATHS ---
 ASSETS_PATH = Path(__file__).parent.parent / "assets"
 ICONS_PATH = ASSETS_PATH / "icons"
-MODELS_PATH = ASSETS_PATH / "models"
 JS_PATH = ASSETS_PATH / "js"
+# Served by Streamlit at ./app/static/ when server.enableStaticServing is on
+STATIC_PATH = Path(__file__).parent.parent / "static"
+STATIC_URL = "./app/static"
+MODELS_PATH = STATIC_PATH
+GLOBE_MODEL_NAME = "submarine_fiber_optic_cable_network.glb"
 
-def get_asset_path(asset_dir: Path, asset_name: str) -> Path:
-    """Constructs and checks the path for an asset."""
-    return asset_dir / asset_name
+@lru_cache(maxsize=32)
+def _encode_asset(path_str: str, mtime_ns: int, compress: bool = False) -> str:
+    """Base64-encode a file, gzipping it first if compress is set.
 
-def get_asset_as_base64(asset_path: Path) -> str | None:
-    """Reads an asset file and returns its base64 encoded version."""
-    if not asset_path.is_file():
-        return None
+    mtime_ns is part of the cache key only. The file is memory-mapped and
+    encoded in place, so large assets are not first copied into an
+    intermediate bytes object.
+    """
+    # Unbuffered: the data is read through the mapping, never through f.
+    with open(path_str, "rb", buffering=0) as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files cannot be mapped
+            return ""
+        with mapped:
+            data = gzip.compress(mapped, compresslevel=6) if compress else mapped
+            return _b64.b64encode(data).decode("ascii")
+
+def get_asset_as_base64(asset_path: Path, compress: bool = False) -> str | None:
+    """Reads an asset file and returns its base64 encoded version.
+
+    With compress=True the file is gzipped before encoding. The result is
+    cached per (path, modification time), so Streamlit reruns reuse the
+    encoded string until the file changes on disk.
+    """
     try:
-        with open(asset_path, "rb") as f:
-            return base64.b64encode(f.read()).decode()
-    except Exception:
+        return _encode_asset(str(asset_path), asset_path.stat().st_mtime_ns, compress)
+    except OSError:
         return None
 
 def get_icon(icon_name: str, **kwargs) -> str:
     """Returns the HTML for a styled SVG icon."""
-    icon_path = get_asset_path(ICONS_PATH, icon_name)
-    icon_svg = ""
-    if icon_path.is_file():
+    return _icon_html(icon_name, tuple(kwargs.items()))
+
+def prepare_icons(icon_names: Iterable[str], **kwargs) -> dict[str, str]:
+    """Build the icon HTML for several icons at once, keyed by icon name.
+
+    Pages that render many icons can call this once up front and pass the
+    resulting strings to the card renderers via icon_html.
+    """
+    style_overrides = tuple(kwargs.items())
+    return {name: _icon_html(name, style_overrides) for name in icon_names}
+
+def _load_icon_svgs() -> dict[str, str]:
+    """Read every SVG in the icons folder, keyed by file name."""
+    svgs = {}
+    for icon_path in ICONS_PATH.glob("*.svg"):
         try:
-            with open(icon_path, "r") as f:
-                icon_svg = f.read()
-        except Exception:
+            svgs[icon_path.name] = icon_path.read_text(encoding="utf-8")
+        except OSError:
             pass
+    return svgs
 
-    # Default style - small size to match text
-    style = "width: 16px; height: 16px; margin-right: 6px; vertical-align: middle; display: inline-block;"
-    
-    # Apply overrides from kwargs
-    for key, value in kwargs.items():
-        style += f" {key.replace('_', '-')}: {value};"
+# The icon set is small and static, so it is read once at import
+_SVG_CACHE: dict[str, str] = _load_icon_svgs()
+
+# Default icon style - small size to match text
+_ICON_STYLE_PARTS = (
+    "width: 16px;", "height: 16px;", "margin-right: 6px;",
+    "vertical-align: middle;", "display: inline-block;",
+)
+
+@lru_cache(maxsize=128)
+def _icon_html(icon_name: str, style_overrides: tuple) -> str:
+    """Build the icon HTML for get_icon; cached per name and style overrides."""
+    icon_svg = _SVG_CACHE.get(icon_name, "")
+
+    # Default style, followed by the overrides from kwargs
+    style = " ".join([
+        *_ICON_STYLE_PARTS,
+        *(f"{key.replace('_', '-')}: {value};" for key, value in style_overrides),
+    ])
 
     return f'<span style="{style}">{icon_svg}</span>'
 
+def get_model_url(model_name: str) -> str | None:
+    """Returns the static-serving URL for a 3D model, if it can be served."""
+    if not st.get_option("server.enableStaticServing"):
+        return None
+    if not (MODELS_PATH / model_name).is_file():
+        return None
+    return f"{STATIC_URL}/{model_name}"
+
 def get_model_as_base64(model_name: str) -> str | None:
-    """Returns the base64 encoded data URI for a 3D model."""
-    model_path = get_asset_path(MODELS_PATH, model_name)
-    b64_model = get_asset_as_base64(model_path)
+    """Returns a gzipped, base64 encoded data URI for a 3D model.
+
+    modern_3d.html recognises the application/gzip media type and inflates
+    the model with DecompressionStream before parsing it.
+    """
+    model_path = MODELS_PATH / model_name
+    b64_model = get_asset_as_base64(model_path, compress=True)
     if b64_model:
-        return f"data:model/gltf-binary;base64,{b64_model}"
+        return f"data:application/gzip;base64,{b64_model}"
     return None
 
-def load_custom_css():
-    """Load professional custom CSS styles for the application."""
-    st.markdown("""
-    <style>
-    /* Import Inter font */
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
-
-    /* CSS Variables */
-    :root {
-        --primary-color: #2563eb;
-        --primary-dark: #1e40af;
-        --secondary-color: #64748b;
-        --accent-color: #0ea5e9;
-        --success-color: #10b981;
-        --warning-color: #f59e0b;
-        --error-color: #ef4444;
-        --text-primary: #0f172a;
-        --text-secondary: #475569;
-        --text-muted: #94a3b8;
-        --background-primary: #ffffff;
-        --background-secondary: #f8fafc;
-        --background-tertiary: #f1f5f9;
-        --border-light: #e2e8f0;
-        --border-medium: #cbd5e1;
-        --shadow-sm: 0 1px 2px 0 rgb(0 0 0 / 0.05);
-        --shadow-md: 0 4px 6px -1px rgb(0 0 0 / 0.1), 0 2px 4px -2px rgb(0 0 0 / 0.1);
-        --shadow-lg: 0 10px 15px -3px rgb(0 0 0 / 0.1), 0 4px 6px -4px rgb(0 0 0 / 0.1);
-        --shadow-xl: 0 20px 25px -5px rgb(0 0 0 / 0.1), 0 8px 10px -6px rgb(0 0 0 / 0.1);
-        --radius-sm: 0.375rem;
-        --radius-md: 0.5rem;
-        --radius-lg: 0.75rem;
-        --radius-xl: 1rem;
-    }
+def _read_asset_text(asset_path: Path) -> str:
+    """Read a text asset, returning an empty string if it is unavailable."""
+    try:
+        return asset_path.read_text(encoding="utf-8")
+    except OSError:
+        return ""
 
-    /* Base Styling */
-    html, body, [class*="css"] {
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-        color: var(--text-primary);
-        background-color: var(--background-secondary);
-    }
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_CSS_WHITESPACE_RE = re.compile(r"\s+")
+_CSS_PUNCTUATION_RE = re.compile(r"\s*([{};])\s*")
 
-    /* Main container */
-    .main .block-container {
-        padding-top: 2rem;
-        padding-bottom: 2rem;
-        max-width: 1200px;
-    }
+def _minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from a stylesheet."""
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _CSS_WHITESPACE_RE.sub(" ", css)
+    return _CSS_PUNCTUATION_RE.sub(r"\1", css).strip()
 
-    /* Content boxes */
-    .content-box {
-        background: var(--background-primary);
-        border-radius: var(--radius-lg);
-        padding: 1.5rem;
-        margin: 1rem 0;
-        border: 1px solid var(--border-light);
-        box-shadow: var(--shadow-sm);
-    }
+# Static stylesheet emitted by load_custom_css, read and minified once at import.
+# Streamlit removes elements that are not re-emitted on a rerun, so it is sent
+# every run.
+# Inter is loaded with <link> tags rather than a CSS @import, which would
+# block the stylesheet until the font CSS arrived. Only the weights in use.
+_FONT_LINKS_HTML = (
+    '<link rel="preconnect" href="https://fonts.googleapis.com">'
+    '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>'
+    '<link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap">'
+)
 
-    /* Headers */
-    h1, h2, h3, h4, h5, h6 {
-        color: var(--text-primary);
-        font-weight: 600;
-        line-height: 1.2;
-    }
+_CUSTOM_CSS_HTML = _FONT_LINKS_HTML + f"<style>{_minify_css(_read_asset_text(ASSETS_PATH / 'styles.css'))}</style>"
 
-    /* Buttons */
-    .stButton > button {
-        background: linear-gradient(135deg, var(--primary-color), var(--primary-dark));
-        color: white;
-        border: none;
-        padding: 0.75rem 1.5rem;
-        border-radius: var(--radius-md);
-        font-weight: 500;
-        font-size: 0.875rem;
-        transition: all 0.2s ease;
-        box-shadow: var(--shadow-sm);
-    }
+# st.html (Streamlit >= 1.33) renders HTML without a markdown pass
+_ST_HTML = getattr(st, "html", None)
 
-    .stButton > button:hover {
-        transform: translateY(-1px);
-        box-shadow: var(--shadow-md);
-        background: linear-gradient(135deg, var(--primary-dark), var(--primary-color));
-    }
+def _emit_html(html: str):
+    """Render an HTML fragment, skipping markdown parsing where st.html exists.
 
-    /* Remove default Streamlit branding */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {visibility: hidden;}
-    </style>
-    """, unsafe_allow_html=True)
+    Used for card and header markup only. The <style>/<link> blocks stay
+    on st.markdown, as st.html sanitizes <link> and spaces style-only output.
+    """
+    if _ST_HTML is not None:
+        _ST_HTML(html)
+    else:
+        st.markdown(html, unsafe_allow_html=True)
 
-def display_page_header(title: str, subtitle: str = "", icon_name: str = ""):
-    """Display a styled page header with optional icon."""
-    icon_html = get_icon(icon_name, width="28px", height="28px") if icon_name else ""
-    
-    st.markdown(f"""
+def load_custom_css():
+    """Load professional custom CSS styles for the application."""
+    st.markdown(_CUSTOM_CSS_HTML, unsafe_allow_html=True)
+
+_PAGE_HEADER_HTML = """
     <div style="margin-bottom: 2rem;">
         <h1 style="display: flex; align-items: center; margin-bottom: 0.5rem; font-size: 2rem; line-height: 1.2;">
             {icon_html}{title}
         </h1>
-        {f'<p style="color: var(--text-secondary); font-size: 1.1rem; margin: 0;">{subtitle}</p>' if subtitle else ''}
+        {subtitle_html}
     </div>
-    """, unsafe_allow_html=True)
+    """
 
-def display_interactive_background():
-    """Display an interactive background with particles or 3D elements."""
-    st.markdown("""
-    <style>
+_PAGE_SUBTITLE_HTML = '<p style="color: var(--text-secondary); font-size: 1.1rem; margin: 0;">{subtitle}</p>'
+
+def display_page_header(title: str, subtitle: str = "", icon_name: str = ""):
+    """Display a styled page header with optional icon."""
+    icon_html = get_icon(icon_name, width="28px", height="28px") if icon_name else ""
+    subtitle_html = _PAGE_SUBTITLE_HTML.format(subtitle=subtitle) if subtitle else ""
+    
+    _emit_html(_PAGE_HEADER_HTML.format(icon_html=icon_html, title=title, subtitle_html=subtitle_html))
+
+_BACKGROUND_CSS_HTML = "<style>" + _minify_css("""
     .stApp {
         background: linear-gradient(-45deg, #f8fafc, #f1f5f9, #e2e8f0, #f8fafc);
-        background-size: 400% 400%;
-        animation: gradientShift 15s ease infinite;
+        background-size: 200% 200%;
     }
     
-    @keyframes gradientShift {
-        0% { background-position: 0% 50%; }
-        50% { background-position: 100% 50%; }
-        100% { background-position: 0% 50%; }
+    /* Animate only for users who have not asked for reduced motion */
+    @media (prefers-reduced-motion: no-preference) {
+        .stApp {
+            animation: gradientShift 15s ease infinite;
+            will-change: background-position;
+        }
+    
+        @keyframes gradientShift {
+            0% { background-position: 0% 50%; }
+            50% { background-position: 100% 50%; }
+            100% { background-position: 0% 50%; }
+        }
     }
-    </style>
-    """, unsafe_allow_html=True)
+""") + "</style>"
 
-def render_metric_card(title: str, value: str, delta: str = None, delta_color: str = "normal"):
-    """Render a styled metric card."""
-    delta_html = ""
-    if delta:
-        delta_class = "success" if delta_color == "normal" else "error"
-        delta_html = f'<div class="metric-delta {delta_class}">{delta}</div>'
-    
-    st.markdown(f"""
+def display_interactive_background():
+    """Display an interactive background with particles or 3D elements."""
+    st.markdown(_BACKGROUND_CSS_HTML, unsafe_allow_html=True)
+
+_METRIC_CARD_HTML = """
     <div class="content-box" style="text-align: center;">
         <h3 style="margin: 0 0 0.5rem 0; color: var(--text-secondary); font-size: 0.875rem; font-weight: 500; text-transform: uppercase;">{title}</h3>
         <div style="font-size: 2rem; font-weight: 700; color: var(--text-primary); margin: 0;">{value}</div>
         {delta_html}
     </div>
-    """, unsafe_allow_html=True)
+    """
 
-def render_policy_card(policy: dict, is_compact: bool = False):
-    """Render a policy information card."""
-    effectiveness = policy.get('effectiveness_score', 0)
-    color = "success" if effectiveness >= 7 else "warning" if effectiveness >= 5 else "error"
-    
-    st.markdown(f"""
+_METRIC_DELTA_HTML = '<div class="metric-delta {delta_class}">{delta}</div>'
+
+_POLICY_CARD_HTML = """
     <div class="content-box">
-        <h3 style="margin: 0 0 1rem 0;">{policy.get('name', 'Unknown Policy')}</h3>
-        <p style="color: var(--text-secondary); margin: 0 0 1rem 0;">{policy.get('description', '')}</p>
+        <h3 style="margin: 0 0 1rem 0;">{name}</h3>
+        <p style="color: var(--text-secondary); margin: 0 0 1rem 0;">{description}</p>
         <div style="display: flex; justify-content: space-between; align-items: center;">
             <span style="color: var(--text-muted);">Effectiveness Score</span>
             <span style="font-weight: 600; color: var(--{color}-color);">{effectiveness}/10</span>
         </div>
     </div>
-    """, unsafe_allow_html=True)
+    """
 
-def render_info_box(content: str, box_type: str = "info"):
-    """Render an information box with different types."""
-    colors = {
-        "info": "var(--primary-color)",
-        "success": "var(--success-color)",  
-        "warning": "var(--warning-color)",
-        "error": "var(--error-color)"
-    }
-    
-    color = colors.get(box_type, colors["info"])
-    
-    st.markdown(f"""
+_HTML_ESCAPE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
+
+def _escape_html(text):
+    """Escape HTML special characters in a single translate() pass."""
+    return text.translate(_HTML_ESCAPE) if isinstance(text, str) else text
+
+def metric_card_html(title: str, value: str, delta: str = None, delta_color: str = "normal") -> str:
+    """Build the HTML for a single metric card."""
+    delta_html = ""
+    if delta:
+        delta_class = "success" if delta_color == "normal" else "error"
+        delta_html = _METRIC_DELTA_HTML.format(delta_class=delta_class, delta=delta)
+    return _METRIC_CARD_HTML.format(title=title, value=value, delta_html=delta_html)
+
+def policy_card_html(policy: dict) -> str:
+    """Build the HTML for a single policy card from an API policy dict or a Policy record."""
+    if isinstance(policy, dict):
+        from utils.data_utils import Policy
+        policy = Policy.from_dict(policy)
+    effectiveness = policy.effectiveness_score
+    color = "success" if effectiveness >= 7 else "warning" if effectiveness >= 5 else "error"
+    return _POLICY_CARD_HTML.format(
+        name=_escape_html(policy.name),
+        description=_escape_html(policy.description),
+        color=color,
+        effectiveness=effectiveness
+    )
+
+def _compact_html(html: str) -> str:
+    """Strip indentation and blank lines so fragments stay one markdown HTML block.
+
+    A blank line ends an HTML block in markdown, and the indented line after
+    it is then rendered as a code block; this matters once several
+    fragments are joined into a single st.markdown call.
+    """
+    return "\n".join(line.strip() for line in html.splitlines() if line.strip())
+
+def _card_grid_html(cards_html: list, columns: int = None) -> str:
+    """Wrap pre-rendered cards in a single grid container.
+
+    columns caps the cards per row; narrow screens still wrap to fewer,
+    like the .card-grid default.
+    """
+    style = (
+        f' style="grid-template-columns: repeat(auto-fit, minmax(max(200px, calc(100% / {columns} - 1rem)), 1fr));"'
+        if columns else ""
+    )
+    return f'<div class="card-grid"{style}>{"".join(map(_compact_html, cards_html))}</div>'
+
+def render_many(*fragments: str):
+    """Render several HTML fragments (e.g. from the *_html builders) with one st.markdown call."""
+    _emit_html("\n".join(map(_compact_html, fragments)))
+
+def render_card_grid(cards_html: list, columns: int = None):
+    """Render pre-built card HTML fragments as one grid with a single st.markdown call."""
+    _emit_html(_card_grid_html(cards_html, columns))
+
+def render_metric_card(title: str, value: str, delta: str = None, delta_color: str = "normal"):
+    """Render a styled metric card."""
+    _emit_html(metric_card_html(title, value, delta, delta_color))
+
+def render_metric_cards(cards: list, columns: int = None):
+    """Render a row of metric cards with a single st.markdown call.
+
+    Each item in cards is a tuple of render_metric_card arguments. The grid
+    fits as many cards per row as space allows, at most columns if given.
+    """
+    render_card_grid([metric_card_html(*card) for card in cards], columns)
+
+def render_policy_card(policy: dict, is_compact: bool = False):
+    """Render a policy information card."""
+    _emit_html(policy_card_html(policy))
+
+def render_policy_cards(policies: list, is_compact: bool = False, columns: int = None):
+    """Render several policy cards with a single st.markdown call."""
+    render_card_grid([policy_card_html(policy) for policy in policies], columns)
+
+_INFO_BOX_COLORS = {
+    "info": "var(--primary-color)",
+    "success": "var(--success-color)",
+    "warning": "var(--warning-color)",
+    "error": "var(--error-color)"
+}
+
+_INFO_BOX_HTML = """
     <div style="
         background: var(--background-primary);
         border-left: 4px solid {color};
@@ -229,25 +333,66 @@ def render_info_box(content: str, box_type: str = "info"):
     ">
         {content}
     </div>
-    """, unsafe_allow_html=True)
+    """
 
-def render_section_header(title: str, description: str = None):
-    """Render a section header with optional description."""
-    st.markdown(f"""
+def info_box_html(content: str, box_type: str = "info") -> str:
+    """Build the HTML for an information box."""
+    color = _INFO_BOX_COLORS.get(box_type, _INFO_BOX_COLORS["info"])
+    return _INFO_BOX_HTML.format(color=color, content=content)
+
+def render_info_box(content: str, box_type: str = "info"):
+    """Render an information box with different types."""
+    _emit_html(info_box_html(content, box_type))
+
+_SECTION_HEADER_HTML = """
     <div style="margin: 2rem 0 1rem 0;">
         <h2 style="margin: 0 0 0.5rem 0;">{title}</h2>
-        {f'<p style="color: var(--text-secondary); margin: 0;">{description}</p>' if description else ''}
+        {description_html}
     </div>
-    """, unsafe_allow_html=True)
+    """
+
+_SECTION_DESCRIPTION_HTML = '<p style="color: var(--text-secondary); margin: 0;">{description}</p>'
+
+def render_section_header(title: str, description: str = None):
+    """Render a section header with optional description."""
+    description_html = _SECTION_DESCRIPTION_HTML.format(description=description) if description else ""
+    _emit_html(_SECTION_HEADER_HTML.format(title=title, description_html=description_html))
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _build_globe_html(model_name: str, template_mtime_ns: int) -> str | None:
+    """Return the globe page for a model, or None if the model is unavailable.
+
+    Cached with st.cache_resource so a single copy of the (possibly
+    multi-megabyte) page is shared by every session and rerun; callers must
+    treat it as read-only. The template mtime is part of the cache key only,
+    so edits to it are picked up, and max_entries bounds the stale copies.
+    """
+    # Prefer the statically served model so the browser fetches and caches the
+    # binary itself; embed it as base64 only when static serving is disabled.
+    model_uri = get_model_url(model_name) or get_model_as_base64(model_name)
+    if not model_uri:
+        return None
+
+    html_template = (ASSETS_PATH / "modern_3d.html").read_text(encoding='utf-8')
+
+    # Fill in the first model URI placeholder only; the template compares
+    # against the literal placeholder later to detect a missing model.
+    prefix, _, suffix = html_template.partition("{{MODEL_URI}}")
+    return "".join((prefix, model_uri, suffix))
 
 def display_3d_globe_component():
     """Display the 3D globe component using the submarine cable GLB model."""
     st.info("🌍 Loading interactive 3D globe... This may take a moment due to the detailed model.")
     
-    # Load the 3D model as base64
-    model_uri = get_model_as_base64("submarine_fiber_optic_cable_network.glb")
+    model_name = GLOBE_MODEL_NAME
+    template_path = ASSETS_PATH / "modern_3d.html"
+    try:
+        html_content = _build_globe_html(model_name, template_path.stat().st_mtime_ns)
+    except OSError:
+        st.error(f"3D template not found: {template_path}")
+        return
     
-    if not model_uri:
+    if not html_content:
         st.error("Failed to load 3D model - file not found or too large")
         # Show fallback visualization
         st.markdown("""
@@ -271,22 +416,12 @@ def display_3d_globe_component():
         """, unsafe_allow_html=True)
         return
     
-    # Load the HTML template and display the 3D model
     try:
-        template_path = ASSETS_PATH / "modern_3d.html"
-        
-        if not template_path.exists():
-            st.error(f"3D template not found: {template_path}")
-            return
-            
-        with open(template_path, 'r', encoding='utf-8') as f:
-            html_template = f.read()
-        
-        # Replace the model URI placeholder
-        html_content = html_template.replace("{{MODEL_URI}}", model_uri)
-        
+        # Imported here so pages without a globe never load the components API
+        from streamlit.components.v1 import html as components_html
+
         # Display in Streamlit using components
-        st.components.v1.html(html_content, height=600, scrolling=False)
+        components_html(html_content, height=600, scrolling=False)
         
         # Show model information
         with st.expander("3D Model Information", expanded=False):
@@ -299,8 +434,8 @@ def display_3d_globe_component():
             with col2:
                 st.metric("Data Coverage", "Global", "99% of international traffic")
             
-            # Check if model is large and show performance note
-            if len(model_uri) > 10_000_000:  # 10MB in base64
+            # The model is only slow to appear when it is embedded in the page
+            if get_model_url(model_name) is None:
                 st.warning("""
                 **Performance Note:** This is a detailed 3D model. If you experience slow loading:
                 - The model may take 10-30 seconds to fully load
@@ -308,12 +443,17 @@ def display_3d_globe_component():
                 - Refresh the page if the model doesn't appear
                 """)
             else:
-                st.success("Model size is optimized for web viewing")
+                st.success("Model is served as a static file and cached by your browser")
                 
     except Exception as e:
         st.error(f"Error loading 3D model: {str(e)}")
         st.info("If you continue to see this error, the model file may be corrupted or too large for your browser.")
 
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _load_simple_globe_html(template_mtime_ns: int) -> str:
+    """Return the lightweight globe page; template_mtime_ns is the cache key only."""
+    return (ASSETS_PATH / "simple_globe.html").read_text(encoding='utf-8')
+
 def display_simple_3d_globe():
     """Display a lightweight 3D globe using Three.js without the heavy model file."""
     st.info("🌍 Interactive 3D Globe - Lightweight Version")
@@ -322,46 +462,44 @@ def display_simple_3d_globe():
         # Load the simple globe HTML template
         simple_globe_path = ASSETS_PATH / "simple_globe.html"
         
-        if simple_globe_path.exists():
-            with open(simple_globe_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-            
-            # Display the lightweight 3D globe
-            st.components.v1.html(html_content, height=500, scrolling=False)
-            
-            # Add information about the lightweight version
-            st.success("✨ **Lightweight 3D Globe** - Fast loading with interactive features")
-            
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Global Internet Users", "5.16B", "4.8%")
-            with col2:
-                st.metric("Submarine Cables", "450+", "Active worldwide")  
-            with col3:
-                st.metric("Data Capacity", "15+ Tbps", "Total global capacity")
-                
-        else:
+        try:
+            html_content = _load_simple_globe_html(simple_globe_path.stat().st_mtime_ns)
+        except OSError:
             st.error(f"Simple globe template not found: {simple_globe_path}")
+            return
+        
+        # Display the lightweight 3D globe
+        from streamlit.components.v1 import html as components_html
+        components_html(html_content, height=500, scrolling=False)
+        
+        # Add information about the lightweight version
+        st.success("✨ **Lightweight 3D Globe** - Fast loading with interactive features")
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Global Internet Users", "5.16B", "4.8%")
+        with col2:
+            st.metric("Submarine Cables", "450+", "Active worldwide")  
+        with col3:
+            st.metric("Data Capacity", "15+ Tbps", "Total global capacity")
             
     except Exception as e:
         st.error(f"Error loading simple 3D globe: {str(e)}")
 
+_METRIC_FORMATTERS = {
+    "percentage": "{:.1f}%".format,
+    "currency": "${:,.0f}".format,
+    "number": "{:,.0f}".format,
+}
+
 def format_metric_value(value, format_type: str = "auto") -> str:
-    """Format metric values for display."""
-    if format_type == "percentage":
-        return f"{value:.1f}%"
-    elif format_type == "currency":
-        return f"${value:,.0f}"
-    elif format_type == "number":
-        return f"{value:,.0f}"
-    else:
+    """Format metric values for display, falling back to str() for non-numeric values."""
+    try:
+        return _METRIC_FORMATTERS.get(format_type, str)(value)
+    except (TypeError, ValueError):
         return str(value)
 
-def render_feature_card(title: str, description: str, icon_name: str = ""):
-    """Render a feature card with icon, title, and description."""
-    icon_html = get_icon(icon_name, width="24px", height="24px") if icon_name else ""
-    
-    st.markdown(f"""
+_FEATURE_CARD_HTML = """
     <div class="content-box" style="margin: 1rem 0;">
         <div style="display: flex; align-items: flex-start; gap: 1rem;">
             {icon_html}
@@ -371,4 +509,18 @@ def render_feature_card(title: str, description: str, icon_name: str = ""):
             </div>
         </div>
     </div>
-    """, unsafe_allow_html=True)
+    """
+
+def feature_card_html(title: str, description: str, icon_name: str = "", icon_html: str | None = None) -> str:
+    """Build the HTML for a feature card.
+
+    icon_html, e.g. from prepare_icons, takes precedence over icon_name.
+    """
+    if icon_html is None:
+        icon_html = get_icon(icon_name, width="24px", height="24px") if icon_name else ""
+    
+    return _FEATURE_CARD_HTML.format(icon_html=icon_html, title=title, description=description)
+
+def render_feature_card(title: str, description: str, icon_name: str = "", icon_html: str | None = None):
+    """Render a feature card with icon, title, and description."""
+    _emit_html(feature_card_html(title, description, icon_name, icon_html))
@@ -6,16 +6,58 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 import numpy as np
 import sys
 import os
-import matplotlib.pyplot as plt
 
 # Add the parent directory to the Python path for module imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_FRONTEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _FRONTEND_DIR not in sys.path:  # the script is re-executed on every rerun
+    sys.path.append(_FRONTEND_DIR)
 
 from utils.api_client import api_client
-from components.ui_components import display_page_header, load_custom_css, display_interactive_background
+from components.ui_components import (
+    display_page_header,
+    load_custom_css,
+    display_interactive_background,
+    render_metric_cards
+)
+
+
+USAGE_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../ml_data/internet_usage.csv'))
+PROFILE_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../ml_data/country_profile_variables.csv'))
+
+# Map region names to continents
+REGION_TO_CONTINENT = {
+    # Africa
+    'NorthernAfrica': 'Africa', 'MiddleAfrica': 'Africa', 'EasternAfrica': 'Africa', 'WesternAfrica': 'Africa', 'SouthernAfrica': 'Africa',
+    # Asia
+    'WesternAsia': 'Asia', 'SouthernAsia': 'Asia', 'South-easternAsia': 'Asia', 'EasternAsia': 'Asia', 'CentralAsia': 'Asia',
+    # Europe
+    'WesternEurope': 'Europe', 'EasternEurope': 'Europe', 'SouthernEurope': 'Europe', 'NorthernEurope': 'Europe',
+    # Americas
+    'NorthernAmerica': 'North America', 'CentralAmerica': 'North America', 'Caribbean': 'North America', 'SouthAmerica': 'South America',
+    # Oceania
+    'Oceania': 'Oceania', 'Polynesia': 'Oceania', 'Melanesia': 'Oceania', 'Micronesia': 'Oceania'
+}
+
+
+@st.cache_data(show_spinner=False)
+def _load_usage_profile() -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Load the internet usage and country profile CSVs once per process."""
+    # Parse the missing-value sentinels here so the year columns load as floats
+    usage = pd.read_csv(USAGE_PATH, na_values=['..', '...', 'N/A', 'n/a'])
+    return usage, pd.read_csv(PROFILE_PATH)
+
+
+@st.cache_data(show_spinner=False)
+def _load_merged() -> pd.DataFrame:
+    """Return the usage table with each country's Continent."""
+    usage, profile = _load_usage_profile()
+    country_to_continent = dict(zip(profile['country'], profile['Region'].map(REGION_TO_CONTINENT)))
+    usage['Continent'] = pd.Categorical(usage['Country Name'].map(country_to_continent))
+    return usage
 
 
 def render_data_trends_page():
@@ -25,142 +67,158 @@ def render_data_trends_page():
         subtitle="See how digital access is changing over time and across different groups.",
         icon_name="data-trends.svg"
     )
-    # --- Custom Internet Access Trend Plot ---
-    col_header1, col_header2 = st.columns(2)
-    
-    usage_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../ml_data/internet_usage.csv'))
-    profile_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../ml_data/country_profile_variables.csv'))
-    if os.path.exists(usage_path) and os.path.exists(profile_path):
-        usage = pd.read_csv(usage_path)
-        profile = pd.read_csv(profile_path)
-        # ...existing code...
-        # --- Animated Choropleth Map: Internet Usage Change by Country ---
-        st.markdown("<hr>", unsafe_allow_html=True)
-        st.subheader("Internet Usage Change by Country (2000–2023)")
-        df_long = pd.melt(usage, id_vars=["Country Name", "Country Code"], var_name="Year", value_name="Value")
-        df_long["Year"] = df_long["Year"].astype(int)
-        # Clean up non-numeric values for choropleth
-        df_long["Value"] = pd.to_numeric(df_long["Value"], errors="coerce")
-        vmin = df_long["Value"].min()
-        vmax = df_long["Value"].max()
-        fig = px.choropleth(
-            df_long,
-            locations="Country Code",
-            color="Value",
-            hover_name="Country Name",
-            animation_frame="Year",
-            color_continuous_scale="Viridis",
-            range_color=[vmin, vmax],
-            projection="natural earth"
-        )
-        fig.update_traces(zmin=vmin, zmax=vmax, selector=dict(type='choropleth'))
-        fig.update_layout(
-            coloraxis_colorbar=dict(title="Change (%)"),
-            title="Internet Usage Change by Country (2000–2023)"
-        )
-        st.plotly_chart(fig, use_container_width=True)
-    
+    if not (os.path.exists(USAGE_PATH) and os.path.exists(PROFILE_PATH)):
+        st.error("internet_usage.csv or country_profile_variables.csv not found in ml_data folder.")
+        return
+
+    merged = _load_merged()
+    usage_columns = merged.columns.drop('Continent')
+    _render_choropleth(merged[usage_columns])
+
     st.markdown('<div class="content-box">', unsafe_allow_html=True)
-    
+
     # --- Custom Internet Access Trend Plot ---
     col_header1, col_header2 = st.columns(2)
     with col_header1:
         st.markdown('<span style="color:#0F172A; font-size:25.6px; font-family:Source Sans Pro, sans-serif; font-weight:bold; display:inline-block;">Internet Access Trends by Country</span>', unsafe_allow_html=True)
     with col_header2:
         st.markdown('<span style="color:#0F172A; font-size:25.6px; font-family:Source Sans Pro, sans-serif; font-weight:bold; display:inline-block;">Average Internet Access by Continent</span>', unsafe_allow_html=True)
-    usage_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../ml_data/internet_usage.csv'))
-    profile_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../ml_data/country_profile_variables.csv'))
-    if os.path.exists(usage_path) and os.path.exists(profile_path):
-        usage = pd.read_csv(usage_path)
-        profile = pd.read_csv(profile_path)
-        # Merge on country name
-        merged = usage.merge(profile[['country', 'Region']], left_on='Country Name', right_on='country', how='left')
-        # Map region names to continents
-        region_to_continent = {
-            # Africa
-            'NorthernAfrica': 'Africa', 'MiddleAfrica': 'Africa', 'EasternAfrica': 'Africa', 'WesternAfrica': 'Africa', 'SouthernAfrica': 'Africa',
-            # Asia
-            'WesternAsia': 'Asia', 'SouthernAsia': 'Asia', 'South-easternAsia': 'Asia', 'EasternAsia': 'Asia', 'CentralAsia': 'Asia',
-            # Europe
-            'WesternEurope': 'Europe', 'EasternEurope': 'Europe', 'SouthernEurope': 'Europe', 'NorthernEurope': 'Europe',
-            # Americas
-            'NorthernAmerica': 'North America', 'CentralAmerica': 'North America', 'Caribbean': 'North America', 'SouthAmerica': 'South America',
-            # Oceania
-            'Oceania': 'Oceania', 'Polynesia': 'Oceania', 'Melanesia': 'Oceania', 'Micronesia': 'Oceania'
-        }
-        merged['Continent'] = merged['Region'].map(region_to_continent)
-        country_list = merged['Country Name'].dropna().unique().tolist()
-        provided_countries = country_list
-        col1, col2 = st.columns(2)
-        with col1:
-            country_name = st.selectbox("Select Country", provided_countries, index=provided_countries.index("Ethiopia") if "Ethiopia" in provided_countries else 0)
-            country_data = merged[merged['Country Name'] == country_name]
-            if not country_data.empty:
-                year_data = country_data.iloc[0, 2:len(usage.columns)].replace(['..', '...', 'N/A', 'n/a'], np.nan)
-                year_values = pd.to_numeric(year_data, errors='coerce').values
-                years = list(range(2000, 2000 + len(year_values)))
-                pct_change = pd.Series(year_values).pct_change() * 100
-                fig, ax1 = plt.subplots(figsize=(8, 5))
-                fig.patch.set_facecolor('#f7fbfc')
-                ax1.set_facecolor('#f7fbfc')
-                ax1.plot(years, year_values, marker='o', color='#0074D9', label='Percent Internet Access', linewidth=3, markersize=10)
-                ax1.set_xlabel('Year', color='#0074D9', fontsize=13)
-                ax1.set_ylabel('Total Internet Access (%)', color='#0074D9', fontsize=13)
-                ax1.tick_params(axis='y', labelcolor='#0074D9', labelsize=12)
-                ax1.tick_params(axis='x', colors='#0074D9', labelsize=12)
-                ax1.grid(True, alpha=0.2, color='#DDDDDD')
-                ax2 = ax1.twinx()
-                ax2.set_facecolor('#f7fbfc')
-                ax2.plot(years, pct_change, marker='o', color='#FF4136', label='% Year-over-Year Change', linewidth=3, markersize=10)
-                ax2.set_ylabel('% Change', color='#FF4136', fontsize=13)
-                ax2.tick_params(axis='y', labelcolor='#FF4136', labelsize=12)
-                ax2.tick_params(axis='x', colors='#0074D9', labelsize=12)
-                # Add legends
-                lines1, labels1 = ax1.get_legend_handles_labels()
-                lines2, labels2 = ax2.get_legend_handles_labels()
-                ax1.legend(lines1 + lines2, labels1 + labels2, loc='upper left', fontsize=12, facecolor='#f7fbfc')
-                plt.title(f'{country_name} - Internet Access and Year-over-Year % Change', color='#0074D9', fontsize=16, weight='bold')
-                fig.tight_layout()
-                st.pyplot(fig)
-            else:
-                st.warning(f"No data available for {country_name}.")
-        with col2:
-            continent_names = ['Africa', 'Asia', 'Europe', 'North America', 'South America', 'Oceania']
-            selected_continent = st.selectbox("Select Continent", continent_names, index=continent_names.index("Africa") if "Africa" in continent_names else 0, key="continent_selectbox_col2")
-            df_continent = merged[merged['Continent'] == selected_continent]
-            MIN_COUNTRIES = 5
-            year_means_continent = {}
-            for year in usage.columns.tolist()[2:]:
-                df_continent[year] = pd.to_numeric(df_continent[year], errors='coerce')
-                values = df_continent[year].values
-                clean_values = values[np.isfinite(values)]
-                if len(clean_values) >= MIN_COUNTRIES:
-                    year_means_continent[year] = np.mean(clean_values)
-                else:
-                    year_means_continent[year] = np.nan
-            df_mean_continent = pd.DataFrame([year_means_continent])
-            fig3, ax3 = plt.subplots(figsize=(8, 5))
-            fig3.patch.set_facecolor('#f7fbfc')
-            ax3.set_facecolor('#f7fbfc')
-            years_cont = df_mean_continent.columns.tolist()
-            means = df_mean_continent.iloc[0].values
-            ax3.plot(years_cont, means, marker='o', linewidth=3, markersize=10, color='#2ECC40', label='Average Internet Access')
-            ax3.set_title(f'Average Internet Access Over Time - {selected_continent}', color='#2ECC40', fontsize=16, weight='bold')
-            ax3.set_xlabel('Year', color='#2ECC40', fontsize=13)
-            ax3.set_ylabel('Average Internet Access (%)', color='#2ECC40', fontsize=13)
-            ax3.grid(True, alpha=0.2, color='#DDDDDD')
-            ax3.tick_params(axis='x', colors='#2ECC40', labelsize=12)
-            ax3.tick_params(axis='y', colors='#2ECC40', labelsize=12)
-            plt.xticks(rotation=45, color='#2ECC40')
-            ax3.legend(loc='upper left', fontsize=12, facecolor='#f7fbfc')
-            fig3.tight_layout()
-            st.pyplot(fig3)
-        # --- Continent Mean Plot ---
-        # ...removed duplicate continent plot and selectbox...
+    col1, col2 = st.columns(2)
+    with col1:
+        _render_country_plot(merged, usage_columns)
+    with col2:
+        _render_continent_plot(merged, usage_columns)
+
+
+def _render_choropleth(usage: pd.DataFrame):
+    """Render the animated internet usage change map."""
+    st.markdown("<hr>", unsafe_allow_html=True)
+    st.subheader("Internet Usage Change by Country (2000–2023)")
+    # Tabs and expanders still run their contents, so only a toggle skips sending the map
+    if st.toggle("Show animated world map", key="show_usage_choropleth"):
+        st.plotly_chart(_build_usage_choropleth(usage), use_container_width=True)
+
+
+def _render_country_plot(merged: pd.DataFrame, usage_columns: pd.Index):
+    """Render internet access and year-over-year change for one country."""
+    provided_countries = merged['Country Name'].dropna().unique().tolist()
+    country_name = st.selectbox("Select Country", provided_countries, index=provided_countries.index("Ethiopia") if "Ethiopia" in provided_countries else 0)
+    country_data = merged[merged['Country Name'] == country_name]
+    if not country_data.empty:
+        year_values = country_data.iloc[0, 2:len(usage_columns)].to_numpy(dtype=float)
+        st.plotly_chart(_build_country_figure(country_name, tuple(year_values)), use_container_width=True)
     else:
-        st.error("internet_usage.csv or country_profile_variables.csv not found in ml_data folder.")
+        st.warning(f"No data available for {country_name}.")
+
+
+def _render_continent_plot(merged: pd.DataFrame, usage_columns: pd.Index):
+    """Render the average internet access over time for one continent."""
+    continent_names = ['Africa', 'Asia', 'Europe', 'North America', 'South America', 'Oceania']
+    selected_continent = st.selectbox("Select Continent", continent_names, index=continent_names.index("Africa") if "Africa" in continent_names else 0, key="continent_selectbox_col2")
+    df_continent = merged[merged['Continent'] == selected_continent]
+    MIN_COUNTRIES = 5
+    year_cols = usage_columns.tolist()[2:]
+    numeric = df_continent[year_cols]
+    # Years reported by fewer than MIN_COUNTRIES countries are left as gaps
+    means_by_year = numeric.mean().where(numeric.count() >= MIN_COUNTRIES)
+    fig = _build_continent_figure(selected_continent, tuple(means_by_year.index), tuple(means_by_year.to_numpy()))
+    st.plotly_chart(fig, use_container_width=True)
+
+
+@st.cache_data(show_spinner=False)
+def _build_country_figure(country_name: str, year_values: tuple) -> go.Figure:
+    """Build the country access / year-over-year change plot; cached per selection."""
+    year_values = np.array(year_values, dtype=float)
+    years = list(range(2000, 2000 + len(year_values)))
+    pct_change = np.full_like(year_values, np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pct_change[1:] = (year_values[1:] - year_values[:-1]) / year_values[:-1] * 100
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    fig.add_trace(go.Scatter(
+        x=years, y=year_values, mode='lines+markers', name='Percent Internet Access',
+        line=dict(color='#0074D9', width=3), marker=dict(size=10)
+    ), secondary_y=False)
+    fig.add_trace(go.Scatter(
+        x=years, y=pct_change, mode='lines+markers', name='% Year-over-Year Change',
+        line=dict(color='#FF4136', width=3), marker=dict(size=10)
+    ), secondary_y=True)
+    fig.update_layout(
+        title=dict(text=f'<b>{country_name} - Internet Access and Year-over-Year % Change</b>', font=dict(color='#0074D9', size=16)),
+        paper_bgcolor='#f7fbfc',
+        plot_bgcolor='#f7fbfc',
+        legend=dict(x=0.01, y=0.99, bgcolor='#f7fbfc')
+    )
+    fig.update_xaxes(title_text='Year', color='#0074D9', gridcolor='#DDDDDD')
+    fig.update_yaxes(title_text='Total Internet Access (%)', color='#0074D9', gridcolor='#DDDDDD', secondary_y=False)
+    fig.update_yaxes(title_text='% Change', color='#FF4136', showgrid=False, secondary_y=True)
+    return fig
+
+
+@st.cache_data(show_spinner=False)
+def _build_continent_figure(continent: str, years_cont: tuple, means: tuple) -> go.Figure:
+    """Build the continent average access plot; cached per selection."""
+    fig = go.Figure(go.Scatter(
+        x=years_cont, y=means, mode='lines+markers', name='Average Internet Access',
+        line=dict(color='#2ECC40', width=3), marker=dict(size=10)
+    ))
+    fig.update_layout(
+        title=dict(text=f'<b>Average Internet Access Over Time - {continent}</b>', font=dict(color='#2ECC40', size=16)),
+        paper_bgcolor='#f7fbfc',
+        plot_bgcolor='#f7fbfc',
+        showlegend=True,
+        legend=dict(x=0.01, y=0.99, bgcolor='#f7fbfc')
+    )
+    fig.update_xaxes(title_text='Year', color='#2ECC40', gridcolor='#DDDDDD', tickangle=-45)
+    fig.update_yaxes(title_text='Average Internet Access (%)', color='#2ECC40', gridcolor='#DDDDDD')
+    return fig
+
+
+@st.cache_data(show_spinner=False)
+def _build_usage_choropleth(usage: pd.DataFrame) -> go.Figure:
+    """Build the animated internet usage choropleth; cached on the usage table."""
+    year_cols = usage.columns[2:].tolist()
+    # Countries with no reported year would only add empty entries to every frame
+    usage = usage.dropna(subset=year_cols, how="all")
+    vmin = usage[year_cols].min().min()
+    vmax = usage[year_cols].max().max()
+    # Locations and hover names are fixed, so each frame only carries that year's values
+    frames = [go.Frame(data=[go.Choropleth(z=usage[year])], name=year) for year in year_cols]
+    step_args = {"frame": {"duration": 0, "redraw": True}, "mode": "immediate",
+                 "fromcurrent": True, "transition": {"duration": 0, "easing": "linear"}}
+    play_args = {"frame": {"duration": 500, "redraw": True}, "mode": "immediate",
+                 "fromcurrent": True, "transition": {"duration": 500, "easing": "linear"}}
+    fig = go.Figure(
+        data=[go.Choropleth(
+            locations=usage["Country Code"],
+            z=usage[year_cols[0]],
+            hovertext=usage["Country Name"],
+            hovertemplate="<b>%{hovertext}</b><br><br>Country Code=%{location}<br>Value=%{z}<extra></extra>",
+            zmin=vmin,
+            zmax=vmax,
+            colorscale="Viridis",
+            colorbar=dict(title="Change (%)"),
+        )],
+        frames=frames,
+    )
+    fig.update_layout(
+        title="Internet Usage Change by Country (2000–2023)",
+        geo=dict(projection_type="natural earth"),
+        updatemenus=[dict(
+            type="buttons", direction="left", showactive=False,
+            x=0.1, xanchor="right", y=0, yanchor="top", pad=dict(r=10, t=70),
+            buttons=[
+                dict(label="&#9654;", method="animate", args=[None, play_args]),
+                dict(label="&#9724;", method="animate", args=[[None], step_args]),
+            ],
+        )],
+        sliders=[dict(
+            active=0, currentvalue=dict(prefix="Year="), len=0.9,
+            x=0.1, xanchor="left", y=0, yanchor="top", pad=dict(b=10, t=60),
+            steps=[dict(label=year, method="animate", args=[[year], step_args]) for year in year_cols],
+        )],
+    )
+    return fig
 
-    # --- Existing API-based sections removed as requested ---
 
 def _render_trend_analysis(trends_data: dict):
     """Render trend analysis metrics."""
@@ -171,37 +229,21 @@ def _render_trend_analysis(trends_data: dict):
         st.warning("No trend data available.")
         return
     
-    for indicator, trend in trends.items():
-        _render_trend_metrics(indicator, trend)
+    # One row of four cards per indicator, all emitted in a single grid
+    render_metric_cards(
+        [card for indicator, trend in trends.items() for card in _trend_metric_cards(indicator, trend)],
+        columns=4
+    )
 
 
-def _render_trend_metrics(indicator: str, trend: dict):
-    """Render individual trend metrics."""
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric(
-            label=indicator.replace('_', ' ').title(),
-            value=f"{trend['end_value']:.1f}%"
-        )
-    
-    with col2:
-        st.metric(
-            label="Absolute Change",
-            value=f"{trend['absolute_change']:+.1f}%"
-        )
-    
-    with col3:
-        st.metric(
-            label="Percentage Change",
-            value=f"{trend['percentage_change']:+.1f}%"
-        )
-    
-    with col4:
-        st.metric(
-            label="Trend",
-            value=f"{trend['trend_direction'].title()}"
-        )
+def _trend_metric_cards(indicator: str, trend: dict) -> list:
+    """Return the metric card rows (title, value) for one trend indicator."""
+    return [
+        (indicator.replace('_', ' ').title(), f"{trend['end_value']:.1f}%"),
+        ("Absolute Change", f"{trend['absolute_change']:+.1f}%"),
+        ("Percentage Change", f"{trend['percentage_change']:+.1f}%"),
+        ("Trend", trend['trend_direction'].title()),
+    ]
 
 
 def _render_demographics_analysis(demographics_data: dict):
@@ -227,43 +269,44 @@ def _render_demographics_analysis(demographics_data: dict):
 
 
 def _render_income_analysis(income_data: dict):
-    """Render income level analysis chart as a 3D scatter plot."""
+    """Render income level analysis chart as a WebGL scatter plot."""
     st.subheader("Digital Access by Income")
     
-    df = pd.DataFrame(income_data)
-    
-    if df.empty:
-        st.warning("No income data available for 3D analysis.")
+    if not income_data:
+        st.warning("No income data available for analysis.")
         return
 
-    df = df.T.reset_index()
-    df.columns = ['Income Level', 'internet_access', 'device_ownership']
+    # A handful of rows: plain lists are cheaper than a DataFrame. Metrics are
+    # taken by position, as the API's metric keys vary.
+    income_levels = list(income_data)
+    rows = [list(metrics.values()) for metrics in income_data.values()]
+    internet_access = [row[0] for row in rows]
+    device_ownership = [row[1] for row in rows]
     
-    # Add a synthetic 'digital_literacy' dimension for 3D effect
-    df['digital_literacy'] = np.random.uniform(low=40, high=90, size=len(df))
-
-    fig = go.Figure(data=[go.Scatter3d(
-        x=df['internet_access'],
-        y=df['device_ownership'],
-        z=df['digital_literacy'],
-        text=df['Income Level'],
+    # Add a synthetic 'digital_literacy' dimension, shown as marker size and colour
+    # Fixed seed so reruns produce the same values and an unchanged figure
+    rng = np.random.default_rng(seed=42)
+    digital_literacy = rng.uniform(low=40, high=90, size=len(rows))
+
+    fig = go.Figure(data=[go.Scattergl(
+        x=internet_access,
+        y=device_ownership,
+        text=income_levels,
         mode='markers',
         marker=dict(
-            size=12,
-            color=df['digital_literacy'], # set color to a variable
+            size=digital_literacy / 3,
+            color=digital_literacy, # set color to a variable
             colorscale='Viridis',   # choose a colorscale
             opacity=0.8,
+            showscale=True,
             colorbar=dict(title='Digital Literacy')
         )
     )])
     
     fig.update_layout(
         title="Digital Access Metrics by Income Level",
-        scene=dict(
-            xaxis_title='Internet Access (%)',
-            yaxis_title='Device Ownership (%)',
-            zaxis_title='Digital Literacy (%)'
-        ),
+        xaxis_title='Internet Access (%)',
+        yaxis_title='Device Ownership (%)',
         margin=dict(r=20, b=10, l=10, t=40)
     )
     st.plotly_chart(fig, use_container_width=True)
@@ -273,24 +316,25 @@ def _render_geographic_analysis(geo_data: dict):
     """Render geographic analysis chart as a 3D bar chart."""
     st.subheader("Digital Access by Geography")
     
-    df = pd.DataFrame(geo_data)
-    
-    if df.empty:
+    if not geo_data:
         st.warning("No geographic data available for 3D analysis.")
         return
 
-    df = df.T.reset_index()
-    df.columns = ['Location', 'broadband_penetration', 'avg_speed']
+    # Metrics are taken by position, as in _render_income_analysis
+    locations = list(geo_data)
+    rows = [list(metrics.values()) for metrics in geo_data.values()]
+    broadband_penetration = [row[0] for row in rows]
+    avg_speed = [row[1] for row in rows]
 
     fig = go.Figure(data=[go.Bar(
-        x=df['Location'],
-        y=df['broadband_penetration'],
-        marker_color=df['avg_speed'],
+        x=locations,
+        y=broadband_penetration,
+        marker_color=avg_speed,
         marker=dict(
             colorscale='Blues',
             colorbar=dict(title='Avg. Speed (Mbps)')
         ),
-        text=df['avg_speed'],
+        text=avg_speed,
         textposition='auto'
     )])
 
@@ -313,7 +357,11 @@ def _render_age_analysis(age_data: dict):
     """Render age group analysis chart as a 3D surface plot."""
     st.subheader("Digital Access by Age Group")
     
-    df = pd.DataFrame(age_data).T.reset_index()
+    if not age_data:
+        st.warning("No age group data available.")
+        return
+
+    df = pd.DataFrame.from_dict(age_data, orient='index').reset_index()
     df.columns = ['Age Group'] + list(df.columns[1:])
     
     fig = px.funnel(df, x='Age Group', y='digital_literacy_rate',
@@ -321,6 +369,9 @@ def _render_age_analysis(age_data: dict):
     st.plotly_chart(fig, use_container_width=True)
 
 
+MAX_CORRELATION_INDICATORS = 10
+
+
 def _render_correlation_analysis(correlation_data: dict):
     """Render correlation analysis heatmap."""
     st.subheader("What's Related?")
@@ -332,15 +383,21 @@ def _render_correlation_analysis(correlation_data: dict):
         
     df = pd.DataFrame(corr_matrix)
     
+    # Keep the most strongly correlated indicators so the annotated heatmap
+    # stays readable and light; original ordering is preserved.
+    if len(df) > MAX_CORRELATION_INDICATORS:
+        strength = df.abs().sum(axis=1).to_numpy()
+        keep = np.sort(np.argsort(strength)[::-1][:MAX_CORRELATION_INDICATORS])
+        df = df.iloc[keep, keep]
+    
     fig = px.imshow(df, text_auto=True, aspect="auto",
                     title="Correlation Matrix of Digital Divide Indicators")
-    st.plotly_chart(fig, use_container_width=True)
+    # Values are printed in each cell, so the chart needs no hover or zoom handlers
+    st.plotly_chart(fig, use_container_width=True, config={'staticPlot': True, 'displayModeBar': False})
 
 
 def main():
     """Main function to set up and render the page."""
-    from components.ui_components import load_custom_css, display_interactive_background
-    
     st.set_page_config(
         page_title="Data Trends - NetEquity",
         layout="wide"
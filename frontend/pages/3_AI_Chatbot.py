@@ -10,7 +10,9 @@ import pandas as pd
 from pathlib import Path
 
 # Add the parent directory to the Python path for module imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_FRONTEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _FRONTEND_DIR not in sys.path:  # the script is re-executed on every rerun
+    sys.path.append(_FRONTEND_DIR)
 
 from utils.api_client import api_client
 from config import CHATBOT_SUGGESTIONS
@@ -509,8 +511,6 @@ We stand ready to collaborate and support these essential initiatives for the di
 
 def main():
     """Main function to set up and render the page."""
-    from components.ui_components import load_custom_css, display_interactive_background
-    
     st.set_page_config(
         page_title="AI Chatbot - NetEquity",
         layout="wide"
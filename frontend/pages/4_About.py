@@ -7,7 +7,9 @@ import sys
 import os
 
 # Add the parent directory to the Python path for module imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_FRONTEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _FRONTEND_DIR not in sys.path:  # the script is re-executed on every rerun
+    sys.path.append(_FRONTEND_DIR)
 
 from components.ui_components import (
     display_page_header, 
@@ -15,7 +17,9 @@ from components.ui_components import (
     render_section_header, 
     load_custom_css,
     display_interactive_background,
-    render_feature_card
+    feature_card_html,
+    prepare_icons,
+    render_many
 )
 
 
@@ -61,41 +65,51 @@ def _render_key_features():
     """Render professional key features section."""
     render_section_header("What You Can Do Here", "A quick tour of the platform's features")
     
+    icons = prepare_icons(
+        ["dashboard.svg", "data-trends.svg", "chatbot.svg",
+         "ml-prediction.svg", "trends.svg", "policy.svg"],
+        width="24px", height="24px"
+    )
+    
     # Create feature cards in columns
     col1, col2 = st.columns(2)
     
     with col1:
-        render_feature_card(
-            "View the Dashboard",
-            "Get a quick overview and navigate to different sections of the platform.",
-            "dashboard.svg"
-        )
-        render_feature_card(
-            "Explore Trends",
-            "See how digital access has changed over time for different groups.",
-            "data-trends.svg"
-        )
-        render_feature_card(
-            "Chat with the AI",
-            "Ask questions in plain English or generate policy petitions based on data.",
-            "chatbot.svg"
+        render_many(
+            feature_card_html(
+                "View the Dashboard",
+                "Get a quick overview and navigate to different sections of the platform.",
+                icon_html=icons["dashboard.svg"]
+            ),
+            feature_card_html(
+                "Explore Trends",
+                "See how digital access has changed over time for different groups.",
+                icon_html=icons["data-trends.svg"]
+            ),
+            feature_card_html(
+                "Chat with the AI",
+                "Ask questions in plain English or generate policy petitions based on data.",
+                icon_html=icons["chatbot.svg"]
+            )
         )
     
     with col2:
-        render_feature_card(
-            "Use ML Predictions",
-            "Predict digital presence using machine learning models based on various factors.",
-            "ml-prediction.svg"
-        )
-        render_feature_card(
-            "Check Demographics",
-            "See how the digital divide affects people based on income, location, and age.",
-            "trends.svg"
-        )
-        render_feature_card(
-            "Visualize Data",
-            "Interact with charts and graphs that bring the data to life.",
-            "policy.svg"
+        render_many(
+            feature_card_html(
+                "Use ML Predictions",
+                "Predict digital presence using machine learning models based on various factors.",
+                icon_html=icons["ml-prediction.svg"]
+            ),
+            feature_card_html(
+                "Check Demographics",
+                "See how the digital divide affects people based on income, location, and age.",
+                icon_html=icons["trends.svg"]
+            ),
+            feature_card_html(
+                "Visualize Data",
+                "Interact with charts and graphs that bring the data to life.",
+                icon_html=icons["policy.svg"]
+            )
         )
 
 
@@ -219,8 +233,6 @@ def _render_contact_info():
 
 def main():
     """Main function to set up and render the page."""
-    from components.ui_components import load_custom_css, display_interactive_background
-    
     st.set_page_config(
         page_title="About - NetEquity",
         layout="wide"
@@ -10,11 +10,16 @@ import subprocess
 
 
 # Add the parent directory to the path to import components
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_FRONTEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _FRONTEND_DIR not in sys.path:  # the script is re-executed on every rerun
+    sys.path.append(_FRONTEND_DIR)
 
 from components.ui_components import (
     display_page_header, 
     render_metric_card, 
+    render_metric_cards,
+    render_many,
+    metric_card_html,
     render_section_header,
     load_custom_css,
     display_interactive_background,
@@ -315,28 +320,11 @@ def render_dataset_overview(predictor):
             st.success(f"Dataset loaded successfully with {len(df)} countries")
             
             # Display basic statistics
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                render_metric_card(
-                    "Countries", 
-                    str(len(df)), 
-                    "Total countries in dataset"
-                )
-            
-            with col2:
-                render_metric_card(
-                    "Features", 
-                    str(len(predictor.features)), 
-                    "Input features for prediction"
-                )
-            
-            with col3:
-                render_metric_card(
-                    "Target Variable", 
-                    "Web Pages/Million", 
-                    "What we're predicting"
-                )
+            render_metric_cards([
+                ("Countries", str(len(df)), "Total countries in dataset"),
+                ("Features", str(len(predictor.features)), "Input features for prediction"),
+                ("Target Variable", "Web Pages/Million", "What we're predicting"),
+            ])
             
             # Show data preview
             st.markdown("#### Data Preview")
@@ -367,21 +355,10 @@ def render_model_training(predictor):
                     results = predictor.train_model(df)
                 
                 if results:
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        render_metric_card(
-                            "R² Score", 
-                            f"{results['r2_score']:.3f}", 
-                            "Model accuracy (higher is better)"
-                        )
-                    
-                    with col2:
-                        render_metric_card(
-                            "MSE", 
-                            f"{results['mse']:,.0f}", 
-                            "Mean Squared Error (lower is better)"
-                        )
+                    render_metric_cards([
+                        ("R² Score", f"{results['r2_score']:.3f}", "Model accuracy (higher is better)"),
+                        ("MSE", f"{results['mse']:,.0f}", "Mean Squared Error (lower is better)"),
+                    ])
                     
                     # Show feature importance if available
                     try:
@@ -555,7 +532,8 @@ def render_feature_simulation():
             # Add the project root to sys.path to import ml_data module
             current_dir = os.path.dirname(os.path.abspath(__file__))
             project_root = os.path.dirname(os.path.dirname(current_dir))
-            sys.path.append(project_root)
+            if project_root not in sys.path:
+                sys.path.append(project_root)
             
             # Change working directory to project root temporarily
             original_cwd = os.getcwd()
@@ -662,19 +640,12 @@ def render_model_training(predictor):
         # Performance metrics
         st.subheader("Model Performance")
         
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            render_metric_card("R² Score", f"{results['r2_score']:.3f}")
-        
-        with col2:
-            render_metric_card("MSE", f"{results['mse']:.0f}")
-        
-        with col3:
-            render_metric_card("Training Size", str(results['training_samples']))
-        
-        with col4:
-            render_metric_card("Test Size", str(results['test_samples']))
+        render_metric_cards([
+            ("R² Score", f"{results['r2_score']:.3f}"),
+            ("MSE", f"{results['mse']:.0f}"),
+            ("Training Size", str(results['training_samples'])),
+            ("Test Size", str(results['test_samples'])),
+        ])
         
         # Performance visualization
         st.subheader("Prediction Accuracy")
@@ -750,9 +721,10 @@ def render_feature_analysis(predictor):
         st.write("**Top Factors**")
         top_features = importance_df.tail(3)
         
-        for i, (_, row) in enumerate(top_features.iterrows()):
-            rank = len(top_features) - i
-            render_metric_card(f"#{rank} {row['feature']}", f"{row['importance']:.3f}")
+        render_many(*(
+            metric_card_html(f"#{len(top_features) - i} {row['feature']}", f"{row['importance']:.3f}")
+            for i, (_, row) in enumerate(top_features.iterrows())
+        ))
     
     # Feature explanations
     st.subheader("Understanding the Features")
@@ -5,11 +5,34 @@ This module provides functions for data validation, transformation,
 and formatting specific to policy and indicator data.
 """
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, NamedTuple, Optional, Union
 from datetime import datetime
 import re
 
 
+class Policy(NamedTuple):
+    """Immutable policy record used by the frontend card renderers."""
+    
+    name: str = 'Unknown Policy'
+    description: str = ''
+    status: str = 'unknown'
+    effectiveness_score: float = 0.0
+    implementation_date: str = ''
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Policy":
+        """
+        Build a Policy from an API response item, ignoring unknown keys.
+        
+        Args:
+            data: Policy dictionary as returned by the API
+            
+        Returns:
+            Policy record with defaults for any missing fields
+        """
+        return cls(**{field: data[field] for field in cls._fields if field in data})
+
+
 class DataValidator:
     """Utility class for data validation operations."""
     